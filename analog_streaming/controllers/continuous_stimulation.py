@@ -1,9 +1,11 @@
 from time import sleep
-from PySide6.QtCore import Slot
-from PySide6.QtWidgets import QHBoxLayout, QWidget
+from typing import Optional
+
+from PySide6.QtCore import QTimer, Slot
+from PySide6.QtWidgets import QDoubleSpinBox, QHBoxLayout, QWidget
 
 from analog_streaming.managers.continuous_manager import ContinuousStimManager
-from analog_streaming.core.data_classes import StimEvent
+from analog_streaming.core.data_classes import RAMP_DIRECTIONS, StimEvent
 from analog_streaming.core.defaults import AmplitudeDefaults, FrequencyDefaults
 from analog_streaming.widgets.composite_widgets.electrode_selector import ElectrodeSelectorWidget
 from analog_streaming.widgets.composite_widgets.instantaneous_control import InstantaneousControlWidget
@@ -11,6 +13,9 @@ from analog_streaming.widgets.composite_widgets.stim_parameters import StimParam
 from analog_streaming.utils.ramp_calculator import RampCalculator
 
 class ContinuousStimWidget(QWidget):
+    # Minimum time between UI refreshes driven by stim events (~60 fps)
+    UI_UPDATE_INTERVAL_MS = 16
+
     def __init__(self, continuous_stim_manager: ContinuousStimManager):
         super().__init__()
 
@@ -25,6 +30,20 @@ class ContinuousStimWidget(QWidget):
         self.amplitude_widget = StimParameterWidget(AmplitudeDefaults.defaults)
         self.instantaneous_widget = InstantaneousControlWidget()
 
+        # During a ramp the worker emits an event per pulse, far faster than
+        # the display refreshes, so only the latest event is shown
+        self._pending_event: Optional[StimEvent] = None
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(self.UI_UPDATE_INTERVAL_MS)
+
+        # Frequency and amplitude changes both invalidate the amplitude
+        # ramps; recalculate once on the next event loop pass instead of
+        # after every change
+        self._amplitude_ramp_timer = QTimer(self)
+        self._amplitude_ramp_timer.setSingleShot(True)
+        self._amplitude_ramp_timer.setInterval(0)
+
         self._init_ui()
         self._connect_signals()
         
@@ -37,7 +56,9 @@ class ContinuousStimWidget(QWidget):
         self.setLayout(main_layout)
 
     def _connect_signals(self):
-        self.stim_manager.signal_event_updated.connect(self._update_ui)
+        self.stim_manager.signal_event_updated.connect(self._queue_ui_update)
+        self._ui_update_timer.timeout.connect(self._apply_pending_event)
+        self._amplitude_ramp_timer.timeout.connect(self._update_all_amplitude_ramps)
         self.stim_manager.signal_last_ramp_event.connect(self._handle_ramp_finished)
 
         self.electrode_selector.signal_electrode_selected.connect(self._handle_electrode_selected)
@@ -56,6 +77,7 @@ class ContinuousStimWidget(QWidget):
         self.amplitude_widget.signal_ramp_requested.connect(self._handle_amplitude_ramp_requested)
         self.amplitude_widget.signal_check_radio_state.connect(self._handle_radio_state)
 
+    @Slot()
     def _handle_radio_state(self):
         self._enable_ramp_radio_buttons(self.instantaneous_widget.is_on())
 
@@ -79,22 +101,48 @@ class ContinuousStimWidget(QWidget):
 
             self.stim_manager.ramp_frequency_from_values(frequency_ramp)
 
-            amplitude_events = [StimEvent(
-                channel=self.stim_manager.current_channel,
-                frequency=new_frequency,
-                amplitude=amplitude,
-                period = 1 / new_frequency
-            ) for amplitude in amplitude_ramp
-            ]
+            # The amplitude events take the manager's current frequency. That
+            # is the staged frequency only because staging always copies the
+            # manager's current values, and no frequency edit can land while
+            # this handler runs on the GUI thread
+            assert new_frequency == self.stim_manager.current_frequency
+            self.stim_manager.staged_events = self.stim_manager.make_amplitude_events_from_values(amplitude_ramp)
+
+    @Slot(StimEvent)
+    def _queue_ui_update(self, event: StimEvent):
+        """Store the latest event and schedule a UI refresh if none is pending."""
+        self._pending_event = event
+        if not self._ui_update_timer.isActive():
+            self._ui_update_timer.start()
+
+    @Slot()
+    def _apply_pending_event(self):
+        self._update_ui(self._pending_event)
 
-            self.stim_manager.staged_events = amplitude_events.copy()
     def _update_ui(self, event: StimEvent):
-        self.frequency_widget.parameter_spinbox.setValue(event.frequency)
-        self.amplitude_widget.parameter_spinbox.setValue(event.amplitude)
+        self._sync_spinbox(self.frequency_widget.parameter_spinbox,
+                           event.frequency,
+                           self.frequency_widget.is_ramping())
+        self._sync_spinbox(self.amplitude_widget.parameter_spinbox,
+                           event.amplitude,
+                           self.amplitude_widget.is_ramping())
+
+    @staticmethod
+    def _sync_spinbox(spinbox: QDoubleSpinBox,
+                      value: float,
+                      is_read_only: bool) -> None:
+        """
+        Sets a spin box's value and read-only state, skipping no-op changes.
 
-        self.frequency_widget.parameter_spinbox.setReadOnly(self.frequency_widget.is_ramping())
-        self.amplitude_widget.parameter_spinbox.setReadOnly(self.amplitude_widget.is_ramping())
+        setValue and setReadOnly refresh the text and repaint even when
+        nothing changes, which adds up while ramp events stream in.
+        """
+        if spinbox.value() != round(value, spinbox.decimals()):
+            spinbox.setValue(value)
+        if spinbox.isReadOnly() != is_read_only:
+            spinbox.setReadOnly(is_read_only)
 
+    @Slot(StimEvent)
     def _handle_ramp_finished(self, event: StimEvent):
         self._handle_current_frequency_changed(event.frequency,
                                                self.frequency_widget.get_ramp_values())
@@ -147,7 +195,7 @@ class ContinuousStimWidget(QWidget):
         # Amplitude is only dependent on current frequency
         # So recalculate when current value changes        
         if self.amplitude_widget.is_enabled():
-            self._update_all_amplitude_ramps()
+            self._amplitude_ramp_timer.start()
 
     @Slot(str, float, float, float)
     def _handle_frequency_ramp_params_changed(self,
@@ -157,7 +205,7 @@ class ContinuousStimWidget(QWidget):
                                               ramp_duration: float):
         intermediates = self.ramp_calculator.generate_single_frequency_ramp(current_value, ramp_target_value, ramp_duration)
 
-        if ramp_param in ["max", "rest", "min"]:
+        if ramp_param in RAMP_DIRECTIONS:
             setattr(self.stim_manager.frequency_ramp_values, ramp_param, intermediates)
 
     @Slot(str)
@@ -181,7 +229,7 @@ class ContinuousStimWidget(QWidget):
         self.stim_manager.set_amplitude(new_value)
 
         if ramp_values:
-            self._update_all_amplitude_ramps()
+            self._amplitude_ramp_timer.start()
     
     @Slot(str, float, float, float)
     def _handle_amplitude_ramp_params_changed(self,
@@ -198,9 +246,10 @@ class ContinuousStimWidget(QWidget):
             duration,
             current_frequency)
 
-        if ramp_param in ["max", "rest", "min"]:
+        if ramp_param in RAMP_DIRECTIONS:
             setattr(self.stim_manager.amplitude_ramp_values, ramp_param, intermediates)
 
+    @Slot()
     def _update_all_amplitude_ramps(self):
         """Recalculate amplitude values when frequency is changed.
         
@@ -216,4 +265,8 @@ class ContinuousStimWidget(QWidget):
     @Slot(str)
     def _handle_amplitude_ramp_requested(self, ramp_direction: str):
         """Frequency ramp requested from current to ramp_direction"""
+        # Don't ramp with stale values if a recalculation is still pending
+        if self._amplitude_ramp_timer.isActive():
+            self._amplitude_ramp_timer.stop()
+            self._update_all_amplitude_ramps()
         self.stim_manager.ramp_amplitude_from_direction(ramp_direction)
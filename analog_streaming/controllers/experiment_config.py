@@ -88,7 +88,7 @@ class ExperimentConfigWindow(QMainWindow):
             return None
         self.config_manager.set_configuration(configuration, export=True)
 
-    @Slot()
+    @Slot(bool)
     def _handle_host_ip_toggle(self, checked: bool) -> None:
         """
         Update IP-related fields based on the checkbox state.
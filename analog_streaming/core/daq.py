@@ -12,6 +12,7 @@ class DAQ:
 
     VOLT_TO_AMP_CONVERSION = 10 / 1000 # DS8R's conversion factor
     AMP_OFFSET = 0.015 # Added to amplitude to minimize DS8R's variability
+    DEVICE_POLL_INTERVAL = 0.5 # Seconds between checks for a connected DAQ
 
     # Cached for faster lookup
     PICO_LOOKUP = {
@@ -29,6 +30,13 @@ class DAQ:
         11: [True, True, True, True],
     }
 
+    # Line states for each D188 channel, built once rather than per pulse.
+    # Pins are reversed, hence the backwards range
+    SWITCHER_LOOKUP = {
+        channel: [channel == i for i in range(8, 0, -1)]
+        for channel in range(9)
+    }
+
    
     def __init__(self,
                  pico_port: int = 1,
@@ -156,8 +164,9 @@ class DAQ:
             channel (int): The channel number to turn on
                 - channel == 0 turns off all channels
         """
-        # Pins are reversed, hence the backwards iteration
-        self.switcher_channels.write([channel == i for i in range(8, 0, -1)])
+        # Unknown channels map to all-LOW, matching channel 0
+        self.switcher_channels.write(
+            self.SWITCHER_LOOKUP.get(channel, self.SWITCHER_LOOKUP[0]))
 
     def trigger(self) -> None:
         """
@@ -186,7 +195,9 @@ class DAQ:
         """Reset all DAQ and Pico outputs to zero."""
         self.set_amplitude(0)
         self.set_channel(0)
-        self.set_pulse_with_pico(0)
+        # Write the Pico's idle state directly; set_pulse_with_pico would
+        # sleep 100ms before writing the same zero pattern a second time
+        self.pico_channels.write(self.PICO_LOOKUP[0])
 
     @staticmethod
     def get_devices() -> List[nidaqmx.system.device.Device]:
@@ -205,8 +216,9 @@ class DAQ:
             print("Waiting for connection...")
             print("Ctrl + C to quit")
 
+            # Each check queries the NI driver, so poll rather than spin
             while not system.devices:
-                pass
+                time.sleep(DAQ.DEVICE_POLL_INTERVAL)
 
             print("Device found! Kept you waiting, huh?")
             time.sleep(1) # Add delay to allow time to read new connection
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import List
 
 @dataclass
@@ -8,6 +8,11 @@ class RampValues:
     min: List[float]
 
 
+# Ramp directions in display order, matching the "ramp_<direction>" and
+# "to_<direction>_duration" keys of the ramp parameters
+RAMP_DIRECTIONS = tuple(field.name for field in fields(RampValues))
+
+
 @dataclass
 class StimEvent:
     channel: int
@@ -1,4 +1,6 @@
+import gc
 import time
+from typing import Optional
 
 from analog_streaming.core.daq import DAQ
 
@@ -17,6 +19,21 @@ class StimWorker:
         daq (DAQ): Data acquisition device interface for stimulation control.
     """
 
+    # Fraction of a period a pulse may run late and still be scheduled from
+    # its original deadline; beyond this the schedule restarts from now
+    MAX_LAG_FRACTION = 0.1
+
+    # Time in seconds before a deadline at which sleeping stops and the
+    # worker busy waits for precise timing
+    SPIN_MARGIN = 0.001
+
+    # Length in seconds of each short sleep taken as the deadline nears
+    SLEEP_SLICE = 0.0005
+
+    # Longest time in seconds the GC stays off without a collection, so
+    # garbage from other threads can't build up over a long session
+    GC_INTERVAL = 60.0
+
     def __init__(self, manager) -> None:
         """
         Initialize the StimWorker with a manager.
@@ -28,6 +45,11 @@ class StimWorker:
         self.running = False
         self.daq = DAQ()
 
+        # Last channel/amplitude written to the DAQ. Each write is a driver
+        # round trip, so unchanged values aren't rewritten on every pulse
+        self._active_channel: Optional[int] = None
+        self._active_amplitude: Optional[float] = None
+
     def run(self) -> None:
         """
         Start the worker loop to process stimulation events.
@@ -35,44 +57,100 @@ class StimWorker:
         Continuously retrieves the next event from the manager and executes 
         stimulation on the specified channel with the defined amplitude. 
         Ensures the loop waits to maintain each event's defined period.
+
+        Each pulse is scheduled against an absolute deadline advanced by the
+        event's period, so time spent fetching events and emitting UI signals
+        doesn't accumulate as drift over a train. If the loop falls behind by
+        more than MAX_LAG_FRACTION of a period, the deadline resyncs to the
+        current time rather than firing pulses back-to-back to catch up.
+
+        Garbage collection is disabled while the loop runs since a collection
+        pass can stall the thread for several milliseconds mid-train. Instead,
+        a collection runs right after a pulse when the event queue has been
+        replaced or GC_INTERVAL has passed, so it eats into the wait for the
+        next pulse.
         """
         self.running = True
-        
-        while self.running:
-            event = self.manager.get_next_event()
-            start_time = time.perf_counter()  # Record start time of stimulation
-
-            # Execute stimulation based on event parameters
-            self._execute_stim(event.channel, event.amplitude)
-                
-            # Calculate and apply remaining sleep duration to respect event period
-            execution_time = time.perf_counter() - start_time
-            sleep_duration = max(0, event.period - execution_time)
-            self._sleep(sleep_duration)
+
+        # The DAQ may have been zeroed since the last session, so start with
+        # a full write. Reset here on the worker thread, since resetting from
+        # stop() could race with an in-flight write and leave a stale cache
+        self._active_channel = None
+        self._active_amplitude = None
+
+        # This disables the GC for the whole process, GUI thread included,
+        # not just this loop; it's restored when the loop exits
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            deadline = time.perf_counter()
+            last_collection = deadline
+            collected_events = self.manager.events
+
+            while self.running:
+                event = self.manager.get_next_event()
+
+                # Absorb small overheads, but don't shorten the next interval
+                # by much to make up for a large overrun
+                now = time.perf_counter()
+                if now - deadline > event.period * self.MAX_LAG_FRACTION:
+                    deadline = now
+
+                # Execute stimulation based on event parameters
+                self._execute_stim(event.channel, event.amplitude)
+
+                deadline += event.period
+
+                # A new queue means a ramp started or parameters changed, and
+                # the schedule is already shifting there
+                events = self.manager.events
+                if (events is not collected_events
+                        or time.perf_counter() - last_collection > self.GC_INTERVAL):
+                    gc.collect()
+                    collected_events = events
+                    last_collection = time.perf_counter()
+
+                self._sleep_until(deadline)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            gc.collect()
 
     def _execute_stim(self, channel: int, amplitude: float) -> None:
         """
         Execute stimulation on a specified channel with a given amplitude.
 
+        Channel and amplitude are only written when they differ from the
+        values already set on the DAQ; the trigger is sent every time.
+
         Args:
             channel: Channel number for the stimulation.
             amplitude: Amplitude value for the stimulation.
         """
-        self.daq.set_channel(channel)
-        self.daq.set_amplitude(amplitude)
+        if channel != self._active_channel:
+            self.daq.set_channel(channel)
+            self._active_channel = channel
+
+        if amplitude != self._active_amplitude:
+            self.daq.set_amplitude(amplitude)
+            self._active_amplitude = amplitude
+
         self.daq.trigger()
 
-    def _sleep(self, duration: float) -> None:
-        # Turn duration into a time that can be meaningfully compared
-        end_time = time.perf_counter() + duration
+    def _sleep_until(self, end_time: float) -> None:
+        # Yield the CPU in a single sleep for the bulk of the wait, stopping
+        # well short of the deadline since the OS may wake the thread late
+        sleep_remaining = end_time - time.perf_counter()
+        if sleep_remaining > 2 * self.SPIN_MARGIN:
+            time.sleep(sleep_remaining - 2 * self.SPIN_MARGIN)
+
+        # Keep yielding in short slices, so even short periods mostly sleep
+        while end_time - time.perf_counter() > self.SPIN_MARGIN:
+            time.sleep(self.SLEEP_SLICE)
 
+        # Busy wait for the last sub-millisecond 
         while time.perf_counter() < end_time:
-            sleep_remaining = end_time - time.perf_counter()
-            if sleep_remaining > 0.001:
-                time.sleep(0.0005)
-            # Busy wait for the last sub-millisecond 
-            else:
-                pass
+            pass
 
     def stop(self) -> None:
         """
@@ -1,12 +1,19 @@
+from collections import deque
+import ctypes
+import gc
+import logging
+import os
 import threading
 from typing import Optional, List
 
 from PySide6.QtCore import QObject, Signal
 
-from analog_streaming.core.data_classes import RampValues, StimEvent
+from analog_streaming.core.data_classes import RAMP_DIRECTIONS, RampValues, StimEvent
 from analog_streaming.core.defaults import AmplitudeDefaults, FrequencyDefaults
 from analog_streaming.core.stim_worker import StimWorker
 
+logger = logging.getLogger(__name__)
+
 
 class ContinuousStimManager(QObject):
     """
@@ -18,6 +25,22 @@ class ContinuousStimManager(QObject):
     signal_event_updated = Signal(StimEvent)
     signal_last_ramp_event = Signal(StimEvent)
 
+    # CPU core the worker thread is pinned to (Linux only). Should be a core
+    # reserved with `isolcpus` so the stim loop isn't preempted; None leaves
+    # scheduling to the OS.
+    WORKER_CPU: Optional[int] = None
+
+    # Whether the worker thread runs at real-time priority (SCHED_FIFO on
+    # Linux, which needs CAP_SYS_NICE or an rtprio limit; time-critical on
+    # Windows). Off by default: the worker busy waits before each pulse and,
+    # above 500 Hz, barely sleeps, so a real-time thread can starve the GUI
+    # and the rest of the machine unless it has a core of its own.
+    REALTIME_PRIORITY: bool = False
+
+    # Whether startup objects have been moved out of the GC's generations.
+    # Class-level so it only happens once per process, however often stim
+    # is started.
+    _gc_frozen: bool = False
 
     def __init__(self) -> None:
         """
@@ -36,10 +59,13 @@ class ContinuousStimManager(QObject):
         
         # Event management queues
         self.staged_events: list[StimEvent] = []
-        self.events: list[StimEvent] = [StimEvent(self.current_channel,
-                                                  self.current_frequency,
-                                                  self.current_amplitude,
-                                                  self.current_period)]
+        # The worker consumes events from the front, so a deque keeps that
+        # O(1). The GUI thread only ever rebinds this attribute to a new
+        # deque, never mutating the one the worker is reading
+        self.events: deque[StimEvent] = deque([StimEvent(self.current_channel,
+                                                         self.current_frequency,
+                                                         self.current_amplitude,
+                                                         self.current_period)])
 
         self.worker: StimWorker = StimWorker(self)
 
@@ -53,6 +79,14 @@ class ContinuousStimManager(QObject):
     def start(self) -> None:
         """Initializes and starts the worker thread."""
         print("Starting Thread")
+        if not ContinuousStimManager._gc_frozen:
+            # Move objects that already exist out of the GC's tracked
+            # generations so any later collection has less to scan. Collect
+            # first, since frozen garbage would never be freed.
+            gc.collect()
+            gc.freeze()
+            ContinuousStimManager._gc_frozen = True
+
         self._running = True
         self._thread = threading.Thread(target=self._run,
                                         daemon=True)
@@ -79,19 +113,21 @@ class ContinuousStimManager(QObject):
         Returns:
             The next stimulation event to process.
         """
-        
+        # Read the queue once; the GUI thread may rebind self.events at any
+        # point, and the length check must hold for the deque that's popped
+        events = self.events
+
         # For single events, reuse the same event for continuous stim
-        if len(self.events) == 2:
-            stim_event = self.events.pop(0)
-            self.signal_last_ramp_event.emit(self.events[0])
-            self.signal_event_updated.emit(self.events[0])
+        if len(events) == 2:
+            stim_event = events.popleft()
+            self.signal_last_ramp_event.emit(events[0])
+            self.signal_event_updated.emit(events[0])
 
-        elif len(self.events) == 1:
-            stim_event = self.events[0]
+        elif len(events) == 1:
+            stim_event = events[0]
         else:
-            stim_event = self.events.pop(0)
+            stim_event = events.popleft()
             self.signal_event_updated.emit(stim_event)
-        print(stim_event)
         return stim_event
     
     def set_channel(self, channel: int):
@@ -107,6 +143,7 @@ class ContinuousStimManager(QObject):
     def set_frequency(self, frequency: float):
         with self._lock:
             self.current_frequency = frequency
+            self.current_period = 1 / frequency
             self._parameters_changed_callback()
 
     def _parameters_changed_callback(self):
@@ -123,7 +160,7 @@ class ContinuousStimManager(QObject):
                 self.current_channel, 
                 self.current_frequency,
                 self.current_amplitude,
-                1/self.current_frequency
+                self.current_period
         )
         self.staged_events.append(event)
 
@@ -143,7 +180,7 @@ class ContinuousStimManager(QObject):
     def apply_changes(self) -> None:
         """Applies staged parameter changes under thread lock protection."""
         if self.staged_events:
-            self.events = self.staged_events.copy()
+            self.events = deque(self.staged_events)
 
     def _run(self) -> None:
         """
@@ -151,12 +188,50 @@ class ContinuousStimManager(QObject):
         
         Monitors for parameter changes in live update mode.
         """
+        if self.WORKER_CPU is not None and hasattr(os, "sched_setaffinity"):
+            # PID 0 targets the calling thread, i.e. this worker thread
+            try:
+                os.sched_setaffinity(0, {self.WORKER_CPU})
+            except OSError as e:
+                # E.g. the core doesn't exist or is offline; run unpinned
+                # rather than letting the thread die with stim shown as on
+                logger.warning("Could not pin worker to CPU %s: %s",
+                               self.WORKER_CPU, e)
+        if self.REALTIME_PRIORITY:
+            self._raise_thread_priority()
+
         while self._running:
             if self._parameters_changed:
                 self.apply_changes()
                 self._parameters_changed = False
             self.worker.run()
 
+    @staticmethod
+    def _raise_thread_priority() -> None:
+        """
+        Raises the calling thread's scheduling priority to reduce pulse jitter.
+
+        Only this thread is affected and the priority ends with it, so nothing
+        needs restoring. On Linux this requires CAP_SYS_NICE or a nonzero
+        RLIMIT_RTPRIO (e.g., an `rtprio` entry in /etc/security/limits.conf).
+        Failure is logged and the thread keeps its default priority.
+        """
+        if hasattr(os, "sched_setscheduler"):
+            # Mid-range real-time priority, below kernel interrupt threads
+            priority = os.sched_get_priority_max(os.SCHED_FIFO) // 2
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            except OSError as e:
+                logger.warning("Could not raise worker to real-time "
+                               "priority: %s", e)
+        elif os.name == "nt":
+            THREAD_PRIORITY_TIME_CRITICAL = 15
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(),
+                                              THREAD_PRIORITY_TIME_CRITICAL):
+                logger.warning("Could not raise worker to time-critical "
+                               "priority: %s", ctypes.WinError())
+
     def ramp_frequency_from_direction(self, ramp_direction: str) -> None:
         """
         Creates a series of events to smoothly transition frequency.
@@ -167,14 +242,14 @@ class ContinuousStimManager(QObject):
         if not self.frequency_ramp_values:
             return
         
-        if ramp_direction in ["max", "rest", "min"]:
+        if ramp_direction in RAMP_DIRECTIONS:
             ramp_values = getattr(self.frequency_ramp_values, ramp_direction)
             self.ramp_frequency_from_values(ramp_values)
         
     def ramp_frequency_from_values(self, ramp_values: List[float]):
-        self.events.clear()
-        events = self.make_frequency_events_from_values(ramp_values)
-        self.events = events.copy()
+        # Rebinding (rather than clearing the old queue first) means the
+        # worker never sees a momentarily empty queue
+        self.events = deque(self.make_frequency_events_from_values(ramp_values))
 
     def ramp_amplitude_from_direction(self, ramp_direction: str) -> None:
         """
@@ -186,14 +261,12 @@ class ContinuousStimManager(QObject):
         if not self.amplitude_ramp_values:
             return        
         
-        if ramp_direction in ["max", "rest", "min"]:
+        if ramp_direction in RAMP_DIRECTIONS:
             ramp_values = getattr(self.amplitude_ramp_values, ramp_direction)
             self.ramp_amplitude_from_values(ramp_values)
 
     def ramp_amplitude_from_values(self, ramp_values: List[float]):
-        self.events.clear()
-        events = self.make_amplitude_events_from_values(ramp_values)
-        self.events = events
+        self.events = deque(self.make_amplitude_events_from_values(ramp_values))
     
     def make_amplitude_events_from_values(self, values: List[float]):
         events = [
@@ -201,7 +274,7 @@ class ContinuousStimManager(QObject):
                 channel=self.current_channel,
                 frequency=self.current_frequency,
                 amplitude=amplitude,
-                period = 1 / self.current_frequency
+                period=self.current_period
             ) for amplitude in values
         ]
         return events
@@ -215,4 +288,4 @@ class ContinuousStimManager(QObject):
                 period = 1 / frequency
             ) for frequency in values
         ]
-        return events       
\ No newline at end of file
+        return events       
\ No newline at end of file
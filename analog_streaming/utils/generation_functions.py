@@ -3,7 +3,7 @@ from inspect import signature, Parameter
 from typing import Type, List, Dict
 
 import numpy as np
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 class FunctionRegistry:
     """
@@ -65,6 +65,12 @@ class AbstractBaseFunctionClass(ABC):
     name = None
     category = None
 
+    # Input validator used for each annotated parameter type
+    validators = {
+        int: QtGui.QIntValidator,
+        float: QtGui.QDoubleValidator,
+    }
+
     def __init_subclass__(cls, **kwargs) -> None:
         """
         When a concrete class is created, add it to the FunctionRegistry.
@@ -82,18 +88,13 @@ class AbstractBaseFunctionClass(ABC):
     
     def generate_subwidget(self) -> None:
         """Create a text input subwidget for each parameter of the function."""
-        main_layout = QtWidgets.QVBoxLayout()
+        # One labeled row per parameter, without a sublayout for each
+        main_layout = QtWidgets.QFormLayout()
     
         method_signature = signature(self.generation_function)
 
         for parameter_name, parameter in method_signature.parameters.items():
-            # Build sublayout for each parameter
-            layout = QtWidgets.QHBoxLayout()
-
             label_text = self.get_label_text(parameter_name)
-            label = QtWidgets.QLabel(f"{label_text}:")
-            layout.addWidget(label)
-
             parameter_input = QtWidgets.QLineEdit()
 
              # Set default value if available
@@ -101,9 +102,16 @@ class AbstractBaseFunctionClass(ABC):
                 default_value = parameter.default
                 parameter_input.setText(str(default_value))
 
+            # Reject non-numeric text as it's typed rather than when parsed
+            validator_class = self.validators.get(parameter.annotation)
+            if validator_class is not None:
+                validator = validator_class(parameter_input)
+                # Match Python's number parsing regardless of system locale
+                validator.setLocale(QtCore.QLocale.c())
+                parameter_input.setValidator(validator)
+
             self.subwidgets.append(parameter_input)
-            layout.addWidget(parameter_input)
-            main_layout.addLayout(layout)
+            main_layout.addRow(f"{label_text}:", parameter_input)
 
         self.widget.setLayout(main_layout)
         
@@ -134,34 +142,26 @@ class RecruitmentCurveAmplitudes(AbstractBaseFunctionClass):
                             h_threshold: float,
                             h_saturation: float,
                             ) -> Type[np.ndarray]:
-        h_space = [
-            h_threshold,
-            ((h_saturation-h_threshold) * 0.05 + h_threshold),
-            ((h_saturation-h_threshold) * 0.25 + h_threshold),
-            ((h_saturation-h_threshold) * 0.50 + h_threshold),
-            ((h_saturation-h_threshold) * 0.75 + h_threshold),
-            h_saturation
-        ]
-                
-        m_space = [
-            m_threshold,
-            ((m_saturation-m_threshold) * 0.05 + m_threshold),
-            ((m_saturation-m_threshold) * 0.25 + m_threshold),
-            ((m_saturation-m_threshold) * 0.50 + m_threshold),
-            ((m_saturation-m_threshold) * 0.75 + m_threshold),
-            m_saturation
-        ]
+        # Fractions of the way from threshold to saturation; the endpoints
+        # themselves are listed explicitly so they stay exact
+        fractions = np.array([0.05, 0.25, 0.50, 0.75])
+
+        endpoints = np.array([h_threshold, h_saturation,
+                              m_threshold, m_saturation])
+        h_space = (h_saturation - h_threshold) * fractions + h_threshold
+        m_space = (m_saturation - m_threshold) * fractions + m_threshold
                             
         h_m_misc = np.array([
-             0.5 * m_threshold,
+            0.5 * m_threshold,
             0.5 * h_threshold,
             1.1 * m_saturation,
             1.1 * h_saturation
         ])
                 
-        x = np.concatenate((h_space, m_space, h_m_misc), axis=None)
+        x = np.concatenate((endpoints, h_space, m_space, h_m_misc))
         x.sort()
-        return np.vstack((x,x,x)).flatten(order='F')
+        # Each amplitude is delivered three times in a row
+        return np.repeat(x, 3)
     
 
 class FWaveAmplitudes(AbstractBaseFunctionClass):
@@ -1,30 +1,26 @@
+from bisect import insort
+from functools import lru_cache
+import logging
 import numpy as np
 from typing import List, Tuple
 
-from analog_streaming.core.data_classes import RampValues
+from analog_streaming.core.data_classes import RAMP_DIRECTIONS, RampValues
+
+logger = logging.getLogger(__name__)
 
 class RampCalculator:
     """Class to calculate ramp values over a specified duration."""
+
     def generate_all_frequency_ramps(self,
                                      current_frequency: float,
                                      ramp_parameters: dict) -> RampValues:
-        max_intermediates = self.generate_single_frequency_ramp(
-            current_frequency,
-            ramp_parameters["ramp_max"],
-            ramp_parameters["to_max_duration"])
-        rest_intermediates = self.generate_single_frequency_ramp(
-            current_frequency,
-            ramp_parameters["ramp_rest"],
-            ramp_parameters["to_rest_duration"])
-        min_intermediates = self.generate_single_frequency_ramp(
-            current_frequency,
-            ramp_parameters["ramp_min"],
-            ramp_parameters["to_min_duration"])
-
-        return RampValues(
-            max = max_intermediates,
-            rest = rest_intermediates,
-            min = min_intermediates)
+        return RampValues(**{
+            direction: self.generate_single_frequency_ramp(
+                current_frequency,
+                ramp_parameters[f"ramp_{direction}"],
+                ramp_parameters[f"to_{direction}_duration"])
+            for direction in RAMP_DIRECTIONS
+        })
 
     def generate_single_frequency_ramp(self,
                                        start_frequency: float,
@@ -42,7 +38,13 @@ class RampCalculator:
         if duration == 0:
             return [end_frequency]
 
+        # The worker holds each event for 1/frequency, so pulse times follow
+        # t[n+1] = t[n] + 1/f(t[n]). The closed-form solution for a continuous
+        # linear chirp places pulses closer together than those periods and
+        # would stretch the ramp past `duration`, so the recurrence is stepped.
         results = []
+        # Frequency changes linearly with time, so the slope is loop-invariant
+        slope = (end_frequency - start_frequency) / duration
         current_frequency = start_frequency
         current_time = 0
         period = 1 / current_frequency
@@ -50,61 +52,75 @@ class RampCalculator:
         while current_time + period <= duration:
             results.append(current_frequency)
             current_time += period
-            current_frequency = start_frequency + (end_frequency - start_frequency) * (current_time / duration)
+            current_frequency = start_frequency + slope * current_time
             period = 1 / current_frequency
 
         if current_time < duration:
             remaining_time = duration - current_time
             last_frequency = 1 / remaining_time  # Calculate frequency that fits the remaining time
             if min(start_frequency, end_frequency) < last_frequency < max(start_frequency, end_frequency):
-                results.append(last_frequency)
+                # The stepped frequencies are already monotonic, so slot the
+                # fitted frequency into place rather than re-sorting them all
+                if end_frequency < start_frequency:
+                    insort(results, last_frequency, key=lambda frequency: -frequency)
+                else:
+                    insort(results, last_frequency)
+        # end_frequency bounds every stepped frequency, so it always goes last
         results.append(end_frequency)
 
-        return sorted(results, reverse=(end_frequency < start_frequency))
+        return results
     
     def generate_all_amplitude_ramps(self,
                                      current_amplitude: float,
                                      amplitude_ramp_parameters: dict,
                                      current_frequency: float):          
-        max_intermediates = self.generate_single_amplitude_ramp(
-            current_amplitude,
-            amplitude_ramp_parameters["ramp_max"],
-             amplitude_ramp_parameters["to_max_duration"],
-            current_frequency)
-        rest_intermediates = self.generate_single_amplitude_ramp(
-            current_amplitude,
-            amplitude_ramp_parameters["ramp_rest"],
-             amplitude_ramp_parameters["to_rest_duration"],
-            current_frequency)
-        min_intermediates = self.generate_single_amplitude_ramp(
-            current_amplitude,
-            amplitude_ramp_parameters["ramp_min"],
-            amplitude_ramp_parameters["to_min_duration"],
-            current_frequency)
-
-        return RampValues(
-            max = max_intermediates,
-            rest = rest_intermediates,
-            min = min_intermediates)
+        return RampValues(**{
+            direction: self.generate_single_amplitude_ramp(
+                current_amplitude,
+                amplitude_ramp_parameters[f"ramp_{direction}"],
+                amplitude_ramp_parameters[f"to_{direction}_duration"],
+                current_frequency)
+            for direction in RAMP_DIRECTIONS
+        })
 
     def generate_single_amplitude_ramp(self,
                                        start_amplitude: float,
                                        end_amplitude: float,
                                        duration: float,
                                        current_frequency: float):
+        # Copy so callers can't modify the cached ramp
+        return list(self._amplitude_ramp(start_amplitude,
+                                         end_amplitude,
+                                         duration,
+                                         current_frequency))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _amplitude_ramp(start_amplitude: float,
+                        end_amplitude: float,
+                        duration: float,
+                        current_frequency: float) -> Tuple[float, ...]:
+        """
+        Memoized amplitude ramp calculation.
+
+        All ramps are recalculated whenever the current frequency or
+        amplitude changes (including after every finished ramp), usually
+        with the same inputs as last time.
+        """
         quantity_of_intermediates = int(duration / (1 / current_frequency))
 
         if quantity_of_intermediates == 1:
-            return [end_amplitude]
+            return (end_amplitude,)
     
         elif quantity_of_intermediates == 2:
-            print([((start_amplitude + end_amplitude) / 2), end_amplitude])
-            return [((start_amplitude + end_amplitude) / 2), end_amplitude]
+            intermediates = (((start_amplitude + end_amplitude) / 2), end_amplitude)
+            logger.debug("Two-step amplitude ramp: %s", intermediates)
+            return intermediates
 
 
-        return np.linspace(start_amplitude,
-                           end_amplitude,
-                           quantity_of_intermediates).tolist()
+        return tuple(np.linspace(start_amplitude,
+                                 end_amplitude,
+                                 quantity_of_intermediates).tolist())
 
 
     # Two situations:
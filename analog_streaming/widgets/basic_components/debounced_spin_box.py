@@ -1,6 +1,10 @@
+import logging
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QDoubleSpinBox
 
+logger = logging.getLogger(__name__)
+
 class DebouncedDoubleSpinBox(QDoubleSpinBox):
     """
     A QDoubleSpinBox that implements debounced value changes.
@@ -33,8 +37,6 @@ class DebouncedDoubleSpinBox(QDoubleSpinBox):
         # Previous value is stored to enforce max increase limitations, if any
         self._previous_value: float = None
         self._max_increase: float = max_increase
-        
-        self.signal_value_changed.connect(self._handle_value_changed)
 
         self.setMaximum(max_value) 
 
@@ -109,7 +111,8 @@ class DebouncedDoubleSpinBox(QDoubleSpinBox):
             if change > self._max_increase:
                 # Set to maximum allowed increment
                 new_value = self._previous_value + self._max_increase
-                print(f"Limited to +{self._max_increase} increases; setting to {new_value}.")
+                logger.warning("Limited to +%s increases; setting to %s.",
+                               self._max_increase, new_value)
                 self.setValue(new_value)
     
     def _handle_value_changed(self) -> None:
@@ -27,6 +27,8 @@ class ElectrodeButton(QPushButton):
         SIZE (int): Fixed size dimension for the button in pixels
         DEFAULT_COLOR (Qt.GlobalColor): Color used when button is not selected
         SELECTED_COLOR (QColor): Color used when button is selected
+        OUTLINE_PEN (QPen): Pen used for the electrode outline and label
+        BASE_SHAPE (QRect): Bounds of the electrode shape within the button
         channel_id (int): Unique identifier for the electrode
         shape_type (ElectrodeShape): Visual shape of the electrode
     """
@@ -34,6 +36,12 @@ class ElectrodeButton(QPushButton):
     DEFAULT_COLOR: Qt.GlobalColor = Qt.white
     SELECTED_COLOR: QColor = QColor(89, 229, 75)
 
+    # Paint objects are shared by all buttons rather than built every paint
+    OUTLINE_PEN: QPen = QPen(Qt.black, 2)
+    BASE_SHAPE: QRect = QRect(5, 5, 40, 40)
+    _DEFAULT_BRUSH: QBrush = QBrush(DEFAULT_COLOR)
+    _SELECTED_BRUSH: QBrush = QBrush(SELECTED_COLOR)
+
     def __init__(self,
                  channel_id: int,
                  shape_type: ElectrodeShape = ElectrodeShape.circle,
@@ -50,6 +58,9 @@ class ElectrodeButton(QPushButton):
 
         self.channel_id = channel_id
         self.shape_type = shape_type
+
+        # The label never changes, so build it once rather than every paint
+        self._label = "-" if channel_id == 0 else str(channel_id)
         self.setCheckable(True)
         self.setFixedSize(self.SIZE, self.SIZE)
 
@@ -65,10 +76,9 @@ class ElectrodeButton(QPushButton):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        base_shape = QRect(5, 5, 40, 40)
         self._set_painter_colors(painter)
-        self._draw_electrode_shape(painter, base_shape)
-        self._add_channel_id(painter, base_shape)
+        self._draw_electrode_shape(painter, self.BASE_SHAPE)
+        self._add_channel_id(painter, self.BASE_SHAPE)
 
     def _set_painter_colors(self, painter: QPainter) -> None:
         """
@@ -80,9 +90,9 @@ class ElectrodeButton(QPushButton):
         Args:
             painter: The QPainter instance to configure
         """
-        painter.setPen(QPen(Qt.black, 2))
-        color = self.SELECTED_COLOR if self.isChecked() else self.DEFAULT_COLOR
-        painter.setBrush(QBrush(color))
+        painter.setPen(self.OUTLINE_PEN)
+        brush = self._SELECTED_BRUSH if self.isChecked() else self._DEFAULT_BRUSH
+        painter.setBrush(brush)
 
     def _draw_electrode_shape(self, painter: QPainter, shape: QRect) -> None:
         """
@@ -108,5 +118,4 @@ class ElectrodeButton(QPushButton):
             painter: The QPainter instance to use for drawing
             shape: The QRect instance on which to draw
         """
-        text = "-" if self.channel_id == 0 else str(self.channel_id)
-        painter.drawText(shape, Qt.AlignCenter, text)
+        painter.drawText(shape, Qt.AlignCenter, self._label)
@@ -14,6 +14,11 @@ class SlideToggle(QWidget):
 
     GREEN = QColor(89, 229, 75)  # Color of ON state
     GRAY = QColor(200, 200, 200)  # Color of OFF state
+    OFF_TEXT_COLOR = QColor(124, 124, 124)
+    HANDLE_PEN = QPen(Qt.white, 1)
+    HANDLE_SIZE = 22  # Diameter of the handle
+    HANDLE_TOP = 4  # Offset of the handle from the top edge
+    HANDLE_MARGIN = 1  # Spill of the handle's antialiased pen on each side
 
     def __init__(self,
                  width = 60,
@@ -31,6 +36,11 @@ class SlideToggle(QWidget):
         self._toggle_height = height
         self.setFixedSize(self._toggle_width, self._toggle_height)
 
+        # Built once here rather than on every paint of the animation
+        self._text_font = QFont("Arial", 8)
+        self._on_text_rect = QRect(4, 0, 26, self._toggle_height)
+        self._off_text_rect = QRect(30, 0, 26, self._toggle_height)
+
         self._is_checked = False
         self._handle_position = 4
 
@@ -48,11 +58,22 @@ class SlideToggle(QWidget):
     def handle_position(self, pos: float) -> None:
         """Sets the position of the toggle handle and triggers a repaint.
 
+        Only the strip spanning the old and new handle positions is
+        repainted, since nothing else changes between animation frames.
+
         Args:
             pos (float): The new position of the handle
         """
+        left = int(min(self._handle_position, pos))
+        right = int(max(self._handle_position, pos))
         self._handle_position = pos
-        self.update()
+        # Pad by the pen's spill on each side, plus 1px on the right for the
+        # truncation of the positions above
+        margin = self.HANDLE_MARGIN
+        self.update(QRect(left - margin,
+                          self.HANDLE_TOP - margin,
+                          right - left + self.HANDLE_SIZE + 2 * margin + 1,
+                          self.HANDLE_SIZE + 2 * margin))
 
     def mousePressEvent(self, event) -> None:
         """Handles mouse press events to toggle the switch state.
@@ -64,6 +85,8 @@ class SlideToggle(QWidget):
         """
         if event.button() == Qt.LeftButton:
             self._is_checked = not self._is_checked
+            # Background and text change with the state, so repaint it all once
+            self.update()
             self._animate()
             self.signal_toggled.emit(self._is_checked)  
 
@@ -128,9 +151,12 @@ class SlideToggle(QWidget):
         Args:
             painter (QPainter): The painter used for drawing the handle
         """
-        painter.setPen(QPen(Qt.white, 1))
+        painter.setPen(self.HANDLE_PEN)
         painter.setBrush(Qt.white)
-        painter.drawEllipse(QRect(int(self._handle_position), 4, 22, 22))
+        painter.drawEllipse(QRect(int(self._handle_position),
+                                  self.HANDLE_TOP,
+                                  self.HANDLE_SIZE,
+                                  self.HANDLE_SIZE))
 
     def _draw_on_off_text(self, painter: QPainter) -> None:
         """Draws the ON and OFF text labels on the toggle.
@@ -138,16 +164,16 @@ class SlideToggle(QWidget):
         Args:
             painter (QPainter): The painter used for drawing the text
         """
-        painter.setFont(QFont("Arial", 8))
+        painter.setFont(self._text_font)
 
         if self._is_checked:
             painter.setPen(Qt.white)
-            painter.drawText(QRect(4, 0, 26, self._toggle_height),
+            painter.drawText(self._on_text_rect,
                              Qt.AlignCenter,
                              "ON")
         else:
-            painter.setPen(QColor(124,124,124))
-            painter.drawText(QRect(30, 0, 26, self._toggle_height),
+            painter.setPen(self.OFF_TEXT_COLOR)
+            painter.drawText(self._off_text_rect,
                              Qt.AlignCenter,
                              "OFF")
     def is_checked(self) -> bool:
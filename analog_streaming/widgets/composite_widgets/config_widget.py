@@ -63,7 +63,9 @@ class ConfigWidget(QWidget):
         """Connect event signals to their respective methods."""
         self.import_export_buttons.signal_import_requested.connect(self._import_config_requested)
         self.import_export_buttons.signal_export_requested.connect(self._export_config_requested)
-        self.host_ip_checkbox.toggled.connect(self._handle_host_ip_checkbox)
+        # Only user clicks should reset the IP; importing a config sets the
+        # checkbox programmatically after filling in the imported IP
+        self.host_ip_checkbox.clicked.connect(self._handle_host_ip_checkbox)
         self.sensor_map_button.clicked.connect(self._select_sensor_map_requested)
         self.save_dir_button.clicked.connect(self._select_save_dir_requested) 
 
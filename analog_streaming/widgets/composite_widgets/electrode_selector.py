@@ -30,6 +30,13 @@ class ElectrodeSelectorWidget(QWidget):
     """
     signal_electrode_selected = Signal(int)
 
+    # Widget shown for each mode; each is created the first time its mode
+    # is selected
+    MODE_WIDGET_CLASSES = {
+        ElectrodeMode.SINGLE: single_electrode.SingleElectrodeWidget,
+        ElectrodeMode.MULTI: multi_electrode.MultiElectrodeWidget,
+    }
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the electrode selector widget.
@@ -39,11 +46,14 @@ class ElectrodeSelectorWidget(QWidget):
         """
         super().__init__(parent)
 
-        self.single_widget = single_electrode.SingleElectrodeWidget()
-        self.multi_widget = multi_electrode.MultiElectrodeWidget()
+        self._mode_widgets: dict[ElectrodeMode, QWidget] = {}
+        # Tracked here so callers don't have to read back the combo box text
+        self._mode = ElectrodeMode.SINGLE
 
         self._init_ui()
         self._connect_signals()
+
+        self.single_widget = self._get_mode_widget(ElectrodeMode.SINGLE)
         
         # Initialize with single electrode mode
         self._mode_changed(ElectrodeMode.SINGLE.value)
@@ -64,6 +74,8 @@ class ElectrodeSelectorWidget(QWidget):
 
         self.electrode_container = QWidget()
         self.electrode_layout = QVBoxLayout(self.electrode_container)
+        # Mode widgets stay in this layout once created; switching modes
+        # only toggles visibility, and hidden widgets take up no space
         layout.addWidget(self.electrode_container)
         
         self.group_box.setLayout(layout)
@@ -76,13 +88,12 @@ class ElectrodeSelectorWidget(QWidget):
         """
         Connect widget signals to their respective slots.
         
-        Sets up signal connections between the mode selector and electrode
-        widgets to handle mode changes and electrode selection events.
+        Sets up the mode selector's connection to handle mode changes.
+        Electrode widgets are connected as they are created.
         """
-        self.single_widget.signal_electrode_selected.connect(self.signal_electrode_selected.emit)
-        self.multi_widget.signal_electrode_selected.connect(self.signal_electrode_selected.emit)
         self.mode_selector.currentTextChanged.connect(self._mode_changed)
 
+    @Slot(str)
     def _mode_changed(self, mode_text: str):
         """
         Updates the electrode layout based on the selected mode.
@@ -90,28 +101,37 @@ class ElectrodeSelectorWidget(QWidget):
         Args:
             mode_text: Text representing the selected mode from ElectrodeMode
         """
-        self._hide_widget()
-        
-        if mode_text == ElectrodeMode.SINGLE.value:
-            self.electrode_layout.addWidget(self.single_widget)
+        mode = ElectrodeMode(mode_text)
+        self._mode = mode
+        selected_widget = self._get_mode_widget(mode)
+
+        # Hide the other modes' widgets first so two are never visible at once
+        for widget in self._mode_widgets.values():
+            if widget is not selected_widget:
+                widget.hide()
+        selected_widget.show()
+
+        if mode is ElectrodeMode.SINGLE:
             # Select the electrode by default since there is only one
             self.single_widget.set_defaults()
-            self.single_widget.show()
-        else:
-            self.electrode_layout.addWidget(self.multi_widget)
-            self.multi_widget.show()
 
-    def _hide_widget(self) -> None:
+    def _get_mode_widget(self, mode: ElectrodeMode) -> QWidget:
         """
-        Hides all widgets currently in the layout.
-        
-        Removes and hides any widgets present in the electrode layout to
-        prepare for showing a different mode's widget.
+        Returns the widget for a mode, creating it on first use.
+
+        Args:
+            mode: The electrode mode whose widget is needed
+
+        Returns:
+            QWidget: The mode's electrode widget, already in the layout
         """
-        while self.electrode_layout.count():
-            item = self.electrode_layout.takeAt(0)
-            if item.widget():
-                item.widget().hide()
+        widget = self._mode_widgets.get(mode)
+        if widget is None:
+            widget = self.MODE_WIDGET_CLASSES[mode]()
+            widget.signal_electrode_selected.connect(self.signal_electrode_selected.emit)
+            self.electrode_layout.addWidget(widget)
+            self._mode_widgets[mode] = widget
+        return widget
 
     def sizeHint(self) -> QSize:
         """
@@ -141,5 +161,5 @@ class ElectrodeSelectorWidget(QWidget):
         This method ensures the electrode is selected by default when stim is 
         turned on in single electrode mode.
         """
-        if self.mode_selector.currentText() == ElectrodeMode.SINGLE.value:
+        if self._mode is ElectrodeMode.SINGLE:
             self.single_widget.set_defaults()
@@ -1,6 +1,7 @@
-from typing import Optional
+from functools import partial
+from typing import List, Optional
 
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QGridLayout, QWidget
 
 from analog_streaming.widgets.basic_components.electrode_button import ElectrodeButton, ElectrodeShape
@@ -25,6 +26,7 @@ class MultiElectrodeWidget(QWidget):
             parent: Parent widget in the Qt widget hierarchy
         """
         super().__init__(parent)
+        self.electrodes: List[ElectrodeButton] = []
         self._setup_electrode_grid()
 
     def _setup_electrode_grid(self):
@@ -48,13 +50,14 @@ class MultiElectrodeWidget(QWidget):
         grid = QGridLayout()
         for channel_id, shape, row, col in electrode_layout:
             button = ElectrodeButton(channel_id, shape)
-            button.toggled.connect(self._handle_toggle)
+            # Bind the button now so the handler doesn't need sender()
+            button.toggled.connect(partial(self._handle_toggle, button))
             grid.addWidget(button, row, col)
+            self.electrodes.append(button)
 
         self.setLayout(grid)
 
-    @Slot(bool)
-    def _handle_toggle(self, checked: bool):
+    def _handle_toggle(self, button: ElectrodeButton, checked: bool):
         """
         Handle electrode button toggle events.
         
@@ -67,12 +70,12 @@ class MultiElectrodeWidget(QWidget):
         last.
         
         Args:
+            button: The electrode button that was toggled
             checked: Whether the button was checked or unchecked
         """
         if checked:
-            sender = self.sender()
-            self._deselect_all_but_one(sender)
-            self.signal_electrode_selected.emit(sender.channel_id)
+            self._deselect_all_but_one(button)
+            self.signal_electrode_selected.emit(button.channel_id)
         
         elif not self._any_electrodes_checked():
             # -1 acts as deselection flag
@@ -87,7 +90,7 @@ class MultiElectrodeWidget(QWidget):
         Args:
             selected_button: The ElectrodeButton that should remain selected
         """
-        for button in self.findChildren(ElectrodeButton):
+        for button in self.electrodes:
             if button is not selected_button:
                 button.setChecked(False)
 
@@ -101,5 +104,5 @@ class MultiElectrodeWidget(QWidget):
         Returns:
             bool: True if any electrode is checked; False otherwise
         """
-        return any(button.isChecked() for button in self.findChildren(ElectrodeButton))
+        return any(button.isChecked() for button in self.electrodes)
     
\ No newline at end of file
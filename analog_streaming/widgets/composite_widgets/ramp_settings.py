@@ -1,8 +1,12 @@
-from PySide6.QtCore import Signal, Slot
+from functools import partial
+
+from PySide6.QtCore import QSignalBlocker, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
-    QGridLayout, QGroupBox, QLabel, QVBoxLayout, QWidget, QRadioButton
+    QButtonGroup, QGridLayout, QGroupBox, QLabel, QVBoxLayout, QWidget,
+    QRadioButton
 )
 
+from analog_streaming.core.data_classes import RAMP_DIRECTIONS
 from analog_streaming.widgets.basic_components.debounced_spin_box import DebouncedDoubleSpinBox
 
 class RampSettingsWidget(QWidget):
@@ -12,15 +16,18 @@ class RampSettingsWidget(QWidget):
     Attributes:
         signal_ramp_toggled: Emitted when ramp is toggled on or off.
         signal_ramp_requested: Emitted when a specific ramp is requested.
-        signal_max_params_changed: Emitted when max ramp parameters change.
-        signal_rest_params_changed: Emitted when rest ramp parameters change.
-        signal_min_params_changed: Emitted when min ramp parameters change.
+        signal_ramp_params_changed: Emitted with the ramp direction, target
+            value, and duration when a ramp's parameters change.
     """
     
     signal_ramp_toggled = Signal(bool)
     signal_ramp_requested = Signal(str)
     signal_ramp_params_changed = Signal(str, float, float)
 
+    # Window in which edits to a ramp's fields are coalesced into one update,
+    # e.g. tabbing from a ramp's value to its duration
+    PARAMS_DEBOUNCE_MS = 50
+
     def __init__(self, defaults: dict, unit: str = "Milliamps"):
         """
         Initializes the ParameterRampSettingsWidget with default values.
@@ -33,9 +40,14 @@ class RampSettingsWidget(QWidget):
         self.unit = unit
         self.ramp_group_box = QGroupBox("Ramp Settings")
 
-        self.max_radio = QRadioButton("Max")
-        self.rest_radio = QRadioButton("Rest")
-        self.min_radio = QRadioButton("Min")
+        self.radio_group = QButtonGroup(self)
+        radios = []
+        # A radio button's id in the group is its direction's index
+        for button_id, direction in enumerate(RAMP_DIRECTIONS):
+            radio = QRadioButton(direction.capitalize())
+            self.radio_group.addButton(radio, button_id)
+            radios.append(radio)
+        self.max_radio, self.rest_radio, self.min_radio = radios
 
         self.ramp_max = DebouncedDoubleSpinBox(max_increase=defaults["max_increase"])
         self.ramp_rest = DebouncedDoubleSpinBox(max_increase=defaults["max_increase"])
@@ -45,6 +57,19 @@ class RampSettingsWidget(QWidget):
         self.to_rest_duration = DebouncedDoubleSpinBox()
         self.to_min_duration = DebouncedDoubleSpinBox()
 
+        # Target value and duration spin boxes for each ramp direction
+        self._ramp_params = {
+            "max": (self.ramp_max, self.to_max_duration),
+            "rest": (self.ramp_rest, self.to_rest_duration),
+            "min": (self.ramp_min, self.to_min_duration),
+        }
+
+        # Ramp directions with edits not yet emitted, in edit order
+        self._pending_ramp_params: dict[str, None] = {}
+        self._params_timer = QTimer(self)
+        self._params_timer.setSingleShot(True)
+        self._params_timer.setInterval(self.PARAMS_DEBOUNCE_MS)
+
         self._init_ui()
         self._set_defaults(defaults)
         self._connect_signals()       
@@ -58,20 +83,13 @@ class RampSettingsWidget(QWidget):
         ramp_group_box_layout.addWidget(QLabel(f"{self.unit}"), 0, 1)
         ramp_group_box_layout.addWidget(QLabel("Seconds"), 0, 2)
         
-        ramp_group_box_layout.addWidget(self.max_radio, 1, 0)
-        ramp_group_box_layout.addWidget(self.ramp_max, 1, 1)
-        ramp_group_box_layout.addWidget(self.to_max_duration, 1, 2)
-        # ramp_group_box_layout.addWidget(QLabel(f"seconds"), 1, 3)
-
-        ramp_group_box_layout.addWidget(self.rest_radio, 2, 0)
-        ramp_group_box_layout.addWidget(self.ramp_rest, 2, 1)
-        ramp_group_box_layout.addWidget(self.to_rest_duration, 2, 2)
-        # ramp_group_box_layout.addWidget(QLabel(f"seconds"), 2, 3)
-
-        ramp_group_box_layout.addWidget(self.min_radio, 3, 0)
-        ramp_group_box_layout.addWidget(self.ramp_min, 3, 1)
-        ramp_group_box_layout.addWidget(self.to_min_duration, 3, 2)
-        # ramp_group_box_layout.addWidget(QLabel(f"seconds"), 3, 3)
+        # One row per ramp direction, below the headers
+        for button_id, direction in enumerate(RAMP_DIRECTIONS):
+            row = button_id + 1
+            ramp_spinbox, duration_spinbox = self._ramp_params[direction]
+            ramp_group_box_layout.addWidget(self.radio_group.button(button_id), row, 0)
+            ramp_group_box_layout.addWidget(ramp_spinbox, row, 1)
+            ramp_group_box_layout.addWidget(duration_spinbox, row, 2)
         
         self.ramp_group_box.setLayout(ramp_group_box_layout)
         
@@ -83,17 +101,13 @@ class RampSettingsWidget(QWidget):
         """Connects signals to their respective handler methods."""
         self.ramp_group_box.toggled.connect(self._handle_ramp_toggled)
         
-        self.max_radio.toggled.connect(self._handle_ramp_requested)
-        self.rest_radio.toggled.connect(self._handle_ramp_requested)
-        self.min_radio.toggled.connect(self._handle_ramp_requested)
-
-        self.ramp_max.signal_value_changed.connect(self._handle_max_params_changed)
-        self.ramp_rest.signal_value_changed.connect(self._handle_rest_params_changed)
-        self.ramp_min.signal_value_changed.connect(self._handle_min_params_changed)
+        self.radio_group.idToggled.connect(self._handle_ramp_requested)
 
-        self.to_max_duration.signal_value_changed.connect(self._handle_max_params_changed)
-        self.to_rest_duration.signal_value_changed.connect(self._handle_rest_params_changed)
-        self.to_min_duration.signal_value_changed.connect(self._handle_min_params_changed)
+        for ramp_param, spinboxes in self._ramp_params.items():
+            handler = partial(self._handle_ramp_params_changed, ramp_param)
+            for spinbox in spinboxes:
+                spinbox.signal_value_changed.connect(handler)
+        self._params_timer.timeout.connect(self._emit_pending_ramp_params)
 
     def _set_defaults(self, defaults: dict) -> None:
         """
@@ -127,48 +141,46 @@ class RampSettingsWidget(QWidget):
         """
         self.signal_ramp_toggled.emit(is_toggled)
 
-    @Slot(str)
-    def _handle_ramp_requested(self, is_toggled: bool) -> None:
+    @Slot(int, bool)
+    def _handle_ramp_requested(self, button_id: int, is_toggled: bool) -> None:
         """
         Handles ramp requests based on radio button selection.
 
         Emits a signal with str indicating ramp direction (max, rest, or min).
 
         Args:
+            button_id: The toggled radio button's id in the button group.
             is_toggled: The state of the toggle (True for selected).
         """
         if is_toggled:
-            self.signal_ramp_requested.emit(self.sender().text().casefold()) 
+            # Clicking a radio button moves focus out of a spin box being
+            # edited, so make sure the ramp reflects that edit before it runs
+            self._emit_pending_ramp_params()
+            self.signal_ramp_requested.emit(RAMP_DIRECTIONS[button_id])
     
-    def _handle_max_params_changed(self) -> None:
+    def _handle_ramp_params_changed(self, ramp_param: str, *_) -> None:
         """
-        Handles changes in max ramp parameters.
+        Handles changes in a ramp's target value or duration.
         
-        Emits a signal with the new values.
-        """
-        ramp_value = self.ramp_max.value()
-        duration = self.to_max_duration.value()
-        self.signal_ramp_params_changed.emit("max", ramp_value, duration)
-    
-    def _handle_rest_params_changed(self) -> None:
-        """
-        Handles changes in rest ramp parameters.
-        
-        Emits a signal with the new values.
-        """
-        ramp_value = self.ramp_rest.value()
-        duration = self.to_rest_duration.value()
-        self.signal_ramp_params_changed.emit("rest", ramp_value, duration)
+        Queues the ramp direction and (re)starts the debounce timer so a
+        burst of edits results in one signal per direction.
 
-    def _handle_min_params_changed(self) -> None:
-        """
-        Handles changes in min ramp parameters.
-        
-        Emits a signal with the new values.
-        """
-        ramp_value = self.ramp_min.value()
-        duration = self.to_min_duration.value()
-        self.signal_ramp_params_changed.emit("min", ramp_value, duration)
+        Args:
+            ramp_param: The ramp direction ("max", "rest", or "min").
+        """
+        self._pending_ramp_params[ramp_param] = None
+        self._params_timer.start()
+
+    @Slot()
+    def _emit_pending_ramp_params(self) -> None:
+        """Emits a signal with the new values of each edited ramp direction."""
+        self._params_timer.stop()
+        for ramp_param in self._pending_ramp_params:
+            ramp_spinbox, duration_spinbox = self._ramp_params[ramp_param]
+            self.signal_ramp_params_changed.emit(ramp_param,
+                                                 ramp_spinbox.value(),
+                                                 duration_spinbox.value())
+        self._pending_ramp_params.clear()
 
     def is_enabled(self) -> None:
         """Returns whether or not ramping is enabled."""
@@ -176,9 +188,9 @@ class RampSettingsWidget(QWidget):
     
     def is_ramping(self) -> bool:
         """Return True if any ramp radio button is currently selected."""
-        return any([self.max_radio.isChecked(),
-                    self.rest_radio.isChecked(),
-                    self.min_radio.isChecked()])
+        return (self.max_radio.isChecked()
+                or self.rest_radio.isChecked()
+                or self.min_radio.isChecked())
     
     def get_values(self) -> dict:
         """
@@ -200,24 +212,23 @@ class RampSettingsWidget(QWidget):
     def deselect_ramp_buttons(self):
         """Deselect all radio buttons in the group."""
 
-        # Remove mutually exclusivity first since exclusive 
-        # buttons cannot be deselected
-        self._set_radio_mutual_exclusivity(False)
+        # Deselection isn't a ramp request, so don't dispatch the toggles
+        with QSignalBlocker(self.radio_group):
+            # Remove mutually exclusivity first since exclusive 
+            # buttons cannot be deselected
+            self._set_radio_mutual_exclusivity(False)
 
-        self._set_all_radio_checked_state(False)
-        self._set_radio_mutual_exclusivity(True)
+            self._set_all_radio_checked_state(False)
+            self._set_radio_mutual_exclusivity(True)
 
     def _set_radio_mutual_exclusivity(self, is_exclusive: bool):
-        self.max_radio.setAutoExclusive(is_exclusive)
-        self.rest_radio.setAutoExclusive(is_exclusive)
-        self.min_radio.setAutoExclusive(is_exclusive)
+        # The group's exclusivity overrides each button's autoExclusive
+        self.radio_group.setExclusive(is_exclusive)
 
     def _set_all_radio_checked_state(self, is_checked: bool):
-        self.max_radio.setChecked(is_checked)
-        self.rest_radio.setChecked(is_checked)
-        self.min_radio.setChecked(is_checked)
+        for radio in self.radio_group.buttons():
+            radio.setChecked(is_checked)
 
     def set_all_radio_enabled_state(self, is_enabled: bool):
-        self.max_radio.setEnabled(is_enabled)
-        self.rest_radio.setEnabled(is_enabled)
-        self.min_radio.setEnabled(is_enabled)
+        for radio in self.radio_group.buttons():
+            radio.setEnabled(is_enabled)
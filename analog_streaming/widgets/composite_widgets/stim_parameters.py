@@ -1,3 +1,4 @@
+import logging
 from typing import Optional, Dict
 
 from PySide6.QtCore import Signal, Slot
@@ -9,6 +10,8 @@ from analog_streaming.widgets.composite_widgets.ramp_settings import RampSetting
 from analog_streaming.widgets.basic_components.debounced_spin_box import DebouncedDoubleSpinBox
 from analog_streaming.utils.ramp_calculator import RampCalculator
 
+logger = logging.getLogger(__name__)
+
 class StimParameterWidget(QWidget):
     # current value, ramp values
     signal_current_value_changed = Signal(float, dict)
@@ -74,7 +77,7 @@ class StimParameterWidget(QWidget):
     def _handle_current_value_changed(self, value: float):
         """If ramping, signal new for new intermediate calculation."""
         if self.ramp_widget.is_enabled():
-            print("is enabled")
+            logger.debug("Ramping enabled; sending ramp values")
             self.set_all_radio_enabled_state(True)
             ramp_values = self.ramp_widget.get_values()
             self.signal_current_value_changed.emit(value, ramp_values)